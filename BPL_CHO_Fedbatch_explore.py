@@ -42,18 +42,27 @@
 # 2022-09-13 - Updated for FMU-explore 0.9.3
 # 2022-09-22 - Corrected the label of product to MAb
 # 2022-10-05 - Updated for FMU-explore 0.9.5 with disp() that do not include extra parameters with parLocation
+# 2026-10-15 - Updated for FMU-explore 0.9.6 with faster simulation and new functions
+#            - Parameters and states set and read with one set_real() and get_real() of cached value references
+#            - Diagrams of newplot() are functions and results kept in memory, opts['filter'] = result_filter optional
+#            - simu() with ncp and plot=False, and mode='cont' continues the model when parameters are unchanged
+#            - Introduced simu_batch() and sweep() for parameter sweeps in parallel processes or one by one
+#            - disp() corrected for search on parameter name and describe(), describe_parts(), system_info() faster
 #-------------------------------------------------------------------------------------------------------------------
 
 # Setup framework
 import sys
+import re
 import platform
 import locale
+import functools
+import multiprocessing
+import multiprocessing.util
 import numpy as np 
 import matplotlib.pyplot as plt 
 from pyfmi import load_fmu
-from pyfmi.fmi import FMUException
-from itertools import cycle
-from importlib_metadata import version   # included in future Python 3.8
+from pyfmi.fmi import FMUException, FMI2_REAL, FMI2_BOOLEAN
+from itertools import cycle, product
 
 # Set the environment - for Linux a JSON-file in the FMU is read
 if platform.system() == 'Linux': locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
@@ -67,6 +76,12 @@ if platform.system() == 'Linux': locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
 #application_file = 'BPL_CHO.mo'
 #library_file = 'BPL.mo'
 
+# Variables used by the diagrams of newplot() - all variables are stored in the simulation result by default,
+# and opts['filter'] = result_filter stores only these for faster simulation. Note that '[[]' in a filter 
+# is a literal '[' and diagrams with other variables need the filter extended
+result_filter = ['bioreactor.V', 'bioreactor.inlet[[]1].F', 'bioreactor.c[[]*]', 
+                 'bioreactor.culture.q[[]*]', 'bioreactor.culture.q*_over']
+
 global fmu_model, model, opts
 if platform.system() == 'Windows':
    print('Windows - run FMU pre-compiled JModelica 2.14')
@@ -74,12 +89,14 @@ if platform.system() == 'Windows':
    model = load_fmu(fmu_model, log_level=0)
    opts = model.simulate_options()
    opts['silent_mode'] = True
+   opts['result_handling'] = 'memory'
 elif platform.system() == 'Linux':
    print('Linux - run FMU pre-comiled JModelica 2.4')
    fmu_model = 'BPL_CHO_Fedbatch_linux_jm_cs.fmu'    
    model = load_fmu(fmu_model, log_level=7)
    opts = model.simulate_options()
    opts['silent_mode'] = False
+   opts['result_handling'] = 'memory'
 else:    
    print('There is no FMU for this platform')
 
@@ -100,6 +117,13 @@ component_list_minimum = ['bioreactor', 'bioreactor.culture', 'bioreactor.broth_
 #stateDict = model.get_states_list()
 global stateDict
 
+# Cache of value references for parDict and stateDict, created by simu() when needed
+global parCache, parCacheLocations; parCache = None; parCacheLocations = None
+
+# Parameters and states after the last simulation by simu() - the model instance can then be continued
+global simuPrevious; simuPrevious = None
+global stateCache, stateFinalCache
+
 # Create parDict
 global parDict; parDict = {}
 parDict['V_0']    = 0.35          # L
@@ -180,10 +204,93 @@ parLocation['F6'] = 'dosagescheme.table[7,2]'
 parLocation['mu'] = 'bioreactor.culture.mu'
 parLocation['mu_d'] = 'bioreactor.culture.mu_d'
 
+# Layout of the diagrams for each plotType of newplot() - a new plotType is a new entry with:
+#  'grid'      - number of rows and columns of subplots
+#  'axes'      - axes name, subplot position, ylabel and xlabel
+#  'curves'    - axes name, variable in sim_res or function of sim_res, and color
+#  'subtitle'  - axes name and title, besides title of ax11 given to newplot()
+#  'ylim_zero' - axes with lower y-limit set to zero after plotting
+#  'ylim_same' - pairs of axes where the first get the y-limits of the second after plotting
+qG_total = lambda sim_res: -(sim_res['bioreactor.culture.q[3]']+sim_res['bioreactor.culture.qG_over'])
+qG = lambda sim_res: -sim_res['bioreactor.culture.q[3]']
+qGn_total = lambda sim_res: -(sim_res['bioreactor.culture.q[4]']+sim_res['bioreactor.culture.qGn_over'])
+qGn = lambda sim_res: -sim_res['bioreactor.culture.q[4]']
+
+plotLayouts = {}
+
+plotLayouts['TimeSeries'] = {
+   'grid': (4,2),
+   'axes': [('ax11', 1, 'Glucose conc [mM]', ''), ('ax12', 2, 'Lactate conc [mM]', ''),
+            ('ax21', 3, 'Glutamine conc [mM]', ''), ('ax22', 4, 'Ammonia conc [mM]', ''),
+            ('ax31', 5, 'Viable cell conc [1E6/mL]', ''), ('ax32', 6, 'Dead cell conc [1E6/mL]', ''),
+            ('ax41', 7, 'Feed rate [L/h]', 'Time [h]'), ('ax42', 8, 'Volume [L]', 'Time [h]')],
+   'curves': [('ax11', 'bioreactor.c[3]', 'b'), ('ax12', 'bioreactor.c[5]', 'r'),
+              ('ax21', 'bioreactor.c[4]', 'b'), ('ax22', 'bioreactor.c[6]', 'r'),
+              ('ax31', 'bioreactor.c[1]', 'b'), ('ax32', 'bioreactor.c[2]', 'r'),
+              ('ax41', 'bioreactor.inlet[1].F', 'b'), ('ax42', 'bioreactor.V', 'b')]}
+
+plotLayouts['Textbook_1'] = {
+   'grid': (5,2),
+   'axes': [('ax11', 1, 'Glucose [mM]', ''), ('ax12', 2, 'Lactate [mM]', ''),
+            ('ax21', 3, 'Glutamine [mM]', ''), ('ax22', 4, 'Ammonia [mM]', ''),
+            ('ax31', 5, 'Viable cell [1E6/mL]', ''), ('ax32', 6, 'Dead cell conc [1E6/mL]', 'Time [h]'),
+            ('ax41', 7, 'Feed rate [L/h]', ''),
+            ('ax51', 9, 'Volume [L]', 'Time [h]')],
+   'curves': [('ax11', 'bioreactor.c[3]', 'b'), ('ax12', 'bioreactor.c[5]', 'r'),
+              ('ax21', 'bioreactor.c[4]', 'b'), ('ax22', 'bioreactor.c[6]', 'r'),
+              ('ax31', 'bioreactor.c[1]', 'b'), ('ax32', 'bioreactor.c[2]', 'r'),
+              ('ax41', 'bioreactor.inlet[1].F', 'b'), ('ax51', 'bioreactor.V', 'b')]}
+
+plotLayouts['Textbook_2'] = {
+   'grid': (5,3),
+   'axes': [('ax11', 1, 'Glucose [mM]', ''), ('ax12', 2, 'Lactate [mM]', ''), ('ax13', 3, 'qG []', ''),
+            ('ax21', 4, 'Glutamine [mM]', ''), ('ax22', 5, 'Ammonia [mM]', ''), ('ax23', 6, 'qGn []', ''),
+            ('ax31', 7, 'Viable cell [1E6/mL]', ''), ('ax32', 8, 'Dead cell conc [1E6/mL]', 'Time [h]'), 
+            ('ax33', 9, 'mu [1/h]', 'Time [h]'),
+            ('ax41', 10, 'Feed rate [L/h]', ''),
+            ('ax51', 13, 'Volume [L]', 'Time [h]')],
+   'curves': [('ax11', 'bioreactor.c[3]', 'b'), ('ax12', 'bioreactor.c[5]', 'r'),
+              ('ax21', 'bioreactor.c[4]', 'b'), ('ax22', 'bioreactor.c[6]', 'r'),
+              ('ax31', 'bioreactor.c[1]', 'b'), ('ax32', 'bioreactor.c[2]', 'r'),
+              ('ax41', 'bioreactor.inlet[1].F', 'b'), ('ax51', 'bioreactor.V', 'b'),
+              ('ax13', qG_total, 'r'), ('ax13', qG, 'b'),
+              ('ax23', qGn_total, 'r'), ('ax23', qGn, 'b'),
+              ('ax33', 'bioreactor.culture.q[1]', 'b')],
+   'subtitle': ('ax13', '- microscopic world'),
+   'ylim_zero': ['ax11', 'ax13'],
+   'ylim_same': [('ax32', 'ax31')]}
+
+plotLayouts['Textbook_3'] = {
+   'grid': (5,3),
+   'axes': [('ax11', 1, 'Glucose [mM]', ''), ('ax12', 2, 'Lactate [mM]', ''), ('ax13', 3, 'qG []', ''),
+            ('ax21', 4, 'Glutamine [mM]', ''), ('ax22', 5, 'Ammonia [mM]', ''), ('ax23', 6, 'qGn []', ''),
+            ('ax31', 7, 'Viable cell [1E6/mL]', ''), ('ax32', 8, 'Dead cell conc [1E6/mL]', 'Time [h]'), 
+            ('ax33', 9, 'mu [1/h]', 'Time [h]'),
+            ('ax41', 10, 'Feed rate [L/h]', ''), ('ax42', 11, 'mAb []', ''), ('ax43', 12, 'qP []', ''),
+            ('ax51', 13, 'Volume [L]', 'Time [h]')],
+   'curves': [('ax11', 'bioreactor.c[3]', 'b'), ('ax12', 'bioreactor.c[5]', 'r'),
+              ('ax21', 'bioreactor.c[4]', 'b'), ('ax22', 'bioreactor.c[6]', 'r'),
+              ('ax31', 'bioreactor.c[1]', 'b'), ('ax32', 'bioreactor.c[2]', 'r'),
+              ('ax41', 'bioreactor.inlet[1].F', 'b'), ('ax42', 'bioreactor.c[7]', 'g'), 
+              ('ax51', 'bioreactor.V', 'b'),
+              ('ax13', qG_total, 'r'), ('ax13', qG, 'b'),
+              ('ax23', qGn_total, 'r'), ('ax23', qGn, 'b'),
+              ('ax33', 'bioreactor.culture.q[1]', 'b'), ('ax43', 'bioreactor.culture.q[7]', 'g')],
+   'subtitle': ('ax13', '- cell specific rates'),
+   'ylim_zero': ['ax11', 'ax13'],
+   'ylim_same': [('ax32', 'ax31')]}
+
 # Create list of diagrams to be plotted by simu()
 global diagrams
 diagrams = []
 
+def curve(ax, variable, color):
+   """ Diagram that plots variable, name in sim_res or function of sim_res, in the axes ax """
+   if callable(variable):
+      return lambda t, sim_res, linetype: ax.plot(t, variable(sim_res), color=color, linestyle=linetype)
+   else:
+      return lambda t, sim_res, linetype: ax.plot(t, sim_res[variable], color=color, linestyle=linetype)
+
 def newplot(title='Fedbatch cultivation',  plotType='TimeSeries'):
    """ Standard plot window,
         title = '' """
@@ -191,251 +298,31 @@ def newplot(title='Fedbatch cultivation',  plotType='TimeSeries'):
    # Reset pens
    setLines()
 
-   # Globals
-   global ax11, ax12, ax21, ax22, ax31, ax32, ax41, ax42, ax51, ax52  
-   global ax13, ax23, ax33, ax43
-    
    # Plot diagram 
-   if plotType == 'TimeSeries':
+   if plotType in plotLayouts.keys():
+      layout = plotLayouts[plotType]
  
+      # Axes are made available as globals ax11, ax12 etc for diagrams added by the user
       plt.figure()
-      ax11 = plt.subplot(4,2,1); ax12 = plt.subplot(4,2,2)
-      ax21 = plt.subplot(4,2,3); ax22 = plt.subplot(4,2,4)
-      ax31 = plt.subplot(4,2,5); ax32 = plt.subplot(4,2,6)
-      ax41 = plt.subplot(4,2,7); ax42 = plt.subplot(4,2,8)    
-
-      ax11.set_title(title)
-      ax11.grid()
-      ax11.set_ylabel('Glucose conc [mM]')
-
-      ax12.grid()
-      ax12.set_ylabel('Lactate conc [mM]')
-
-      ax21.grid()
-      ax21.set_ylabel('Glutamine conc [mM]')
-
-      ax22.grid()
-      ax22.set_ylabel('Ammonia conc [mM]')
-
-      ax31.grid()
-      ax31.set_ylabel('Viable cell conc [1E6/mL]')
-
-      ax32.grid()
-      ax32.set_ylabel('Dead cell conc [1E6/mL]')
-
-      ax41.grid()
-      ax41.set_ylabel('Feed rate [L/h]')
-      ax41.set_xlabel('Time [h]')
-
-      ax42.grid()
-      ax42.set_ylabel('Volume [L]')
-      ax42.set_xlabel('Time [h]')
-
-      # List of commands to be executed by simu() after a simulation  
-      diagrams.clear()
-      diagrams.append("ax11.plot(t,sim_res['bioreactor.c[3]'], color='b', linestyle=linetype)")       
-      diagrams.append("ax12.plot(t,sim_res['bioreactor.c[5]'], color='r', linestyle=linetype)")       
-      diagrams.append("ax21.plot(t,sim_res['bioreactor.c[4]'], color='b', linestyle=linetype)")       
-      diagrams.append("ax22.plot(t,sim_res['bioreactor.c[6]'], color='r', linestyle=linetype)")       
-      diagrams.append("ax31.plot(t,sim_res['bioreactor.c[1]'], color='b', linestyle=linetype)")       
-      diagrams.append("ax32.plot(t,sim_res['bioreactor.c[2]'], color='r', linestyle=linetype)")       
-      diagrams.append("ax41.plot(t,sim_res['bioreactor.inlet[1].F'], color='b', linestyle=linetype)")       
-      diagrams.append("ax42.plot(t,sim_res['bioreactor.V'], color='b', linestyle=linetype)") 
-
-   if plotType == 'Textbook_1':
- 
-      plt.figure()
-      ax11 = plt.subplot(5,2,1); ax12 = plt.subplot(5,2,2)
-      ax21 = plt.subplot(5,2,3); ax22 = plt.subplot(5,2,4)
-      ax31 = plt.subplot(5,2,5); ax32 = plt.subplot(5,2,6)
-      ax41 = plt.subplot(5,2,7)
-      ax51 = plt.subplot(5,2,9) 
-
-      ax11.set_title(title)
-      ax11.grid()
-      ax11.set_ylabel('Glucose [mM]')
-
-      ax12.grid()
-      ax12.set_ylabel('Lactate [mM]')
-
-      ax21.grid()
-      ax21.set_ylabel('Glutamine [mM]')
-
-      ax22.grid()
-      ax22.set_ylabel('Ammonia [mM]')
-
-      ax31.grid()
-      ax31.set_ylabel('Viable cell [1E6/mL]')
-
-      ax32.grid()
-      ax32.set_ylabel('Dead cell conc [1E6/mL]')
-      ax32.set_xlabel('Time [h]')
-
-      ax41.grid()
-      ax41.set_ylabel('Feed rate [L/h]')
-      
-      ax51.grid()
-      ax51.set_ylabel('Volume [L]')      
-      ax51.set_xlabel('Time [h]')
-
-
-      # List of commands to be executed by simu() after a simulation  
-      diagrams.clear()
-      diagrams.append("ax11.plot(t,sim_res['bioreactor.c[3]'], color='b', linestyle=linetype)")       
-      diagrams.append("ax12.plot(t,sim_res['bioreactor.c[5]'], color='r', linestyle=linetype)")       
-      diagrams.append("ax21.plot(t,sim_res['bioreactor.c[4]'], color='b', linestyle=linetype)")       
-      diagrams.append("ax22.plot(t,sim_res['bioreactor.c[6]'], color='r', linestyle=linetype)")       
-      diagrams.append("ax31.plot(t,sim_res['bioreactor.c[1]'], color='b', linestyle=linetype)")       
-      diagrams.append("ax32.plot(t,sim_res['bioreactor.c[2]'], color='r', linestyle=linetype)")       
-      diagrams.append("ax41.plot(t,sim_res['bioreactor.inlet[1].F'], color='b', linestyle=linetype)")       
-      diagrams.append("ax51.plot(t,sim_res['bioreactor.V'], color='b', linestyle=linetype)") 
-
-   if plotType == 'Textbook_2':
- 
-      plt.figure()
-      ax11 = plt.subplot(5,3,1); ax12 = plt.subplot(5,3,2); ax13 = plt.subplot(5,3,3)
-      ax21 = plt.subplot(5,3,4); ax22 = plt.subplot(5,3,5); ax23 = plt.subplot(5,3,6)
-      ax31 = plt.subplot(5,3,7); ax32 = plt.subplot(5,3,8); ax33 = plt.subplot(5,3,9)
-      ax41 = plt.subplot(5,3,10)
-      ax51 = plt.subplot(5,3,13) 
-
-      ax11.set_title(title)
-      ax11.grid()
-      ax11.set_ylabel('Glucose [mM]')
-
-      ax12.grid()
-      ax12.set_ylabel('Lactate [mM]')
-      
-      ax13.grid()
-      ax13.set_ylabel('qG []')
-
-      ax21.grid()
-      ax21.set_ylabel('Glutamine [mM]')
-
-      ax22.grid()
-      ax22.set_ylabel('Ammonia [mM]')
-      
-      ax23.grid()
-      ax23.set_ylabel('qGn []')
-
-      ax31.grid()
-      ax31.set_ylabel('Viable cell [1E6/mL]')
-
-      ax32.grid()
-      ax32.set_ylabel('Dead cell conc [1E6/mL]')
-      ax32.set_xlabel('Time [h]')
-      
-      ax33.grid()
-      ax33.set_ylabel('mu [1/h]')
-      ax33.set_xlabel('Time [h]')
-
-      ax41.grid()
-      ax41.set_ylabel('Feed rate [L/h]')
-      
-      ax51.grid()
-      ax51.set_ylabel('Volume [L]')      
-      ax51.set_xlabel('Time [h]')
-      
-      # List of commands to be executed by simu() after a simulation  
-      diagrams.clear()
-      diagrams.append("ax11.plot(t,sim_res['bioreactor.c[3]'], color='b', linestyle=linetype)")       
-      diagrams.append("ax12.plot(t,sim_res['bioreactor.c[5]'], color='r', linestyle=linetype)")       
-      diagrams.append("ax21.plot(t,sim_res['bioreactor.c[4]'], color='b', linestyle=linetype)")       
-      diagrams.append("ax22.plot(t,sim_res['bioreactor.c[6]'], color='r', linestyle=linetype)")       
-      diagrams.append("ax31.plot(t,sim_res['bioreactor.c[1]'], color='b', linestyle=linetype)")       
-      diagrams.append("ax32.plot(t,sim_res['bioreactor.c[2]'], color='r', linestyle=linetype)")       
-      diagrams.append("ax41.plot(t,sim_res['bioreactor.inlet[1].F'], color='b', linestyle=linetype)")       
-      diagrams.append("ax51.plot(t,sim_res['bioreactor.V'], color='b', linestyle=linetype)") 
-
-      diagrams.append("ax13.set_title('- microscopic world')") 
-      diagrams.append("ax13.plot(t,-(sim_res['bioreactor.culture.q[3]']+sim_res['bioreactor.culture.qG_over']), color='r', linestyle=linetype)") 
-      diagrams.append("ax13.plot(t,-sim_res['bioreactor.culture.q[3]'], color='b', linestyle=linetype)") 
-      diagrams.append("ax23.plot(t,-(sim_res['bioreactor.culture.q[4]']+sim_res['bioreactor.culture.qGn_over']), color='r', linestyle=linetype)") 
-      diagrams.append("ax23.plot(t,-sim_res['bioreactor.culture.q[4]'], color='b', linestyle=linetype)") 
-      diagrams.append("ax33.plot(t,sim_res['bioreactor.culture.q[1]'], color='b', linestyle=linetype)") 
-      
-      diagrams.append("ax11.set_ylim(0)")
-      diagrams.append("ax13.set_ylim(0)")
-      #diagrams.append("ax31.set_ylim(0)")
-      diagrams.append("ax32.set_ylim(ax31.get_ylim())")
-      #diagrams.append("plt.show()")
-
-   if plotType == 'Textbook_3':
- 
-      plt.figure()
-      ax11 = plt.subplot(5,3,1); ax12 = plt.subplot(5,3,2); ax13 = plt.subplot(5,3,3)
-      ax21 = plt.subplot(5,3,4); ax22 = plt.subplot(5,3,5); ax23 = plt.subplot(5,3,6)
-      ax31 = plt.subplot(5,3,7); ax32 = plt.subplot(5,3,8); ax33 = plt.subplot(5,3,9)
-      ax41 = plt.subplot(5,3,10); ax42 = plt.subplot(5,3,11); ax43 = plt.subplot(5,3,12)
-      ax51 = plt.subplot(5,3,13) 
-
-      ax11.set_title(title)
-      ax11.grid()
-      ax11.set_ylabel('Glucose [mM]')
-
-      ax12.grid()
-      ax12.set_ylabel('Lactate [mM]')
-      
-      ax13.grid()
-      ax13.set_ylabel('qG []')
-
-      ax21.grid()
-      ax21.set_ylabel('Glutamine [mM]')
-
-      ax22.grid()
-      ax22.set_ylabel('Ammonia [mM]')
-      
-      ax23.grid()
-      ax23.set_ylabel('qGn []')
-
-      ax31.grid()
-      ax31.set_ylabel('Viable cell [1E6/mL]')
-
-      ax32.grid()
-      ax32.set_ylabel('Dead cell conc [1E6/mL]')
-      ax32.set_xlabel('Time [h]')
-      
-      ax33.grid()
-      ax33.set_ylabel('mu [1/h]')
-      ax33.set_xlabel('Time [h]')
-
-      ax41.grid()
-      ax41.set_ylabel('Feed rate [L/h]')
-
-      ax42.grid()
-      ax42.set_ylabel('mAb []')
-
-      ax43.grid()
-      ax43.set_ylabel('qP []')
-
-      ax51.grid()
-      ax51.set_ylabel('Volume [L]')      
-      ax51.set_xlabel('Time [h]')
-      
-      # List of commands to be executed by simu() after a simulation  
+      axes = {}
+      for name, position, ylabel, xlabel in layout['axes']:
+         axes[name] = plt.subplot(*layout['grid'], position)
+         axes[name].grid()
+         axes[name].set_ylabel(ylabel)
+         if xlabel: axes[name].set_xlabel(xlabel)
+      axes['ax11'].set_title(title)
+      if 'subtitle' in layout.keys():
+         axes[layout['subtitle'][0]].set_title(layout['subtitle'][1])
+      globals().update(axes)
+
+      # List of diagrams to be plotted by simu() after a simulation
       diagrams.clear()
-      diagrams.append("ax11.plot(t,sim_res['bioreactor.c[3]'], color='b', linestyle=linetype)")       
-      diagrams.append("ax12.plot(t,sim_res['bioreactor.c[5]'], color='r', linestyle=linetype)")       
-      diagrams.append("ax21.plot(t,sim_res['bioreactor.c[4]'], color='b', linestyle=linetype)")       
-      diagrams.append("ax22.plot(t,sim_res['bioreactor.c[6]'], color='r', linestyle=linetype)")       
-      diagrams.append("ax31.plot(t,sim_res['bioreactor.c[1]'], color='b', linestyle=linetype)")       
-      diagrams.append("ax32.plot(t,sim_res['bioreactor.c[2]'], color='r', linestyle=linetype)")       
-      diagrams.append("ax41.plot(t,sim_res['bioreactor.inlet[1].F'], color='b', linestyle=linetype)") 
-      diagrams.append("ax42.plot(t,sim_res['bioreactor.c[7]'], color='g', linestyle=linetype)")       
-      diagrams.append("ax51.plot(t,sim_res['bioreactor.V'], color='b', linestyle=linetype)") 
-
-      diagrams.append("ax13.set_title('- cell specific rates')") 
-      diagrams.append("ax13.plot(t,-(sim_res['bioreactor.culture.q[3]']+sim_res['bioreactor.culture.qG_over']), color='r', linestyle=linetype)") 
-      diagrams.append("ax13.plot(t,-sim_res['bioreactor.culture.q[3]'], color='b', linestyle=linetype)") 
-      diagrams.append("ax23.plot(t,-(sim_res['bioreactor.culture.q[4]']+sim_res['bioreactor.culture.qGn_over']), color='r', linestyle=linetype)") 
-      diagrams.append("ax23.plot(t,-sim_res['bioreactor.culture.q[4]'], color='b', linestyle=linetype)") 
-      diagrams.append("ax33.plot(t,sim_res['bioreactor.culture.q[1]'], color='b', linestyle=linetype)") 
-      diagrams.append("ax43.plot(t,sim_res['bioreactor.culture.q[7]'], color='g', linestyle=linetype)") 
-      
-      diagrams.append("ax11.set_ylim(0)")
-      diagrams.append("ax13.set_ylim(0)")
-      diagrams.append("ax32.set_ylim(ax31.get_ylim())")
-
+      for name, variable, color in layout['curves']:
+         diagrams.append(curve(axes[name], variable, color))
+      for name in layout.get('ylim_zero', []):
+         diagrams.append(lambda t, sim_res, linetype, ax=axes[name]: ax.set_ylim(0))
+      for name, name_ref in layout.get('ylim_same', []):
+         diagrams.append(lambda t, sim_res, linetype, ax=axes[name], ax_ref=axes[name_ref]: ax.set_ylim(ax_ref.get_ylim()))
       
 def describe(name, decimals=3):
    """Look up description of culture, media, as well as parameters and variables in the model code"""
@@ -444,44 +331,7 @@ def describe(name, decimals=3):
       print('Reactor culture CHO-MAb - cell line HB-58 American Culture Collection ATCC') 
 
    elif name in ['broth', 'liquidphase', 'liquid-phase''media']:
-
-      Xv  = model.get('liquidphase.Xv')[0]; 
-      Xv_description = model.get_variable_description('liquidphase.Xv'); 
-      Xv_mw = model.get('liquidphase.mw[1]')[0]
-      
-      Xd = model.get('liquidphase.Xd')[0]; 
-      Xd_description = model.get_variable_description('liquidphase.Xd'); 
-      Xd_mw = model.get('liquidphase.mw[2]')[0]
-      
-      G = model.get('liquidphase.G')[0]; 
-      G_description = model.get_variable_description('liquidphase.G'); 
-      G_mw = model.get('liquidphase.mw[3]')[0]
-      
-      Gn = model.get('liquidphase.Gn')[0]; 
-      Gn_description = model.get_variable_description('liquidphase.Gn'); 
-      Gn_mw = model.get('liquidphase.mw[4]')[0]
-      
-      L = model.get('liquidphase.L')[0]; 
-      L_description = model.get_variable_description('liquidphase.L'); 
-      L_mw = model.get('liquidphase.mw[5]')[0]
-      
-      N = model.get('liquidphase.N')[0]; 
-      N_description = model.get_variable_description('liquidphase.N'); 
-      N_mw = model.get('liquidphase.mw[6]')[0]
-      
-      Pr = model.get('liquidphase.Pr')[0]; 
-      Pr_description = model.get_variable_description('liquidphase.Pr'); 
-      Pr_mw = model.get('liquidphase.mw[7]')[0]
-
-      print('Reactor broth substances included in the model')
-      print()
-      print(Xv_description, 'index = ', Xv, 'molecular weight = ', Xv_mw, 'Da')
-      print(Xd_description, '  index = ', Xd, 'molecular weight = ', Xd_mw, 'Da')
-      print(G_description, '     index = ', G, 'molecular weight = ', G_mw, 'Da')
-      print(Gn_description, '   index = ', Gn, 'molecular weight = ', Gn_mw, 'Da')
-      print(L_description, '     index = ', L, 'molecular weight = ', L_mw, 'Da')
-      print(N_description, '     index = ', N, 'molecular weight = ', N_mw, 'Da')
-      print(Pr_description, '     index = ', Pr, 'molecular weight = ', Pr_mw, 'Da')
+      print(describe_liquidphase())
 
    elif name in ['parts']:
       describe_parts(component_list_minimum)
@@ -492,9 +342,23 @@ def describe(name, decimals=3):
    else:
       describe_general(name, decimals)
 
+# Describe substances of the liquidphase - model constants so the text is made only once
+@functools.lru_cache(maxsize=None)
+def describe_liquidphase():
+   """Text that describe the substances in the liquidphase"""
+   lines = ['Reactor broth substances included in the model', '']
+   for substance, index, text in [('Xv', 1, 'index = '), ('Xd', 2, '  index = '), ('G', 3, '     index = '), 
+                                  ('Gn', 4, '   index = '), ('L', 5, '     index = '), ('N', 6, '     index = '),
+                                  ('Pr', 7, '     index = ')]:
+      description = model.get_variable_description('liquidphase.'+substance)
+      value = model.get('liquidphase.'+substance)[0]
+      mw = model.get('liquidphase.mw['+str(index)+']')[0]
+      lines.append(' '.join([str(description), text, str(value), 'molecular weight = ', str(mw), 'Da']))
+   return '\n'.join(lines)
+
 #------------------------------------------------------------------------------------------------------------------
 #  General code 
-FMU_explore = 'FMU-explore ver 0.9.5'
+FMU_explore = 'FMU-explore ver 0.9.6'
 #------------------------------------------------------------------------------------------------------------------
 
 # Define function par() for parameter update
@@ -531,38 +395,33 @@ def disp(name='', decimals=3, mode='short'):
    """ Display intial values and parameters in the model that include "name" and is in parLocation list.
        Note, it does not take the value from the dictionary par but from the model. """
    global parLocation, model
+
+   # Parameters with name in the location, and if none found, parameters with name in the parameter name
+   parNames = [parName for parName in parDict.keys() if name in parLocation[parName]]
+   if len(parNames) == 0:
+      parNames = [parName for parName in parDict.keys() if name in parName]
+
+   # Values of all parameters from the model with one get_real() call
+   values = {}
+   get_cached(par_cache(), values)
+   booleans = boolean_locations(tuple(parLocation.values()))
    
    if mode in ['short']:
-      k = 0
-      for Location in [parLocation[k] for k in parDict.keys()]:
-         if name in Location:
-            if type(model.get(Location)[0]) != np.bool_:
-               print(dict_reverser(parLocation)[Location] , ':', np.round(model.get(Location)[0],decimals))
-            else:
-               print(dict_reverser(parLocation)[Location] , ':', model.get(Location)[0])               
+      for parName in parNames:
+         if parLocation[parName] not in booleans:
+            print(parName, ':', round(values[parName].item(), decimals))
          else:
-            k = k+1
-      if k == len(parLocation):
-         for parName in parDict.keys():
-            if name in parName:
-               if type(model.get(Location)[0]) != np.bool_:
-                  print(parName,':', np.round(model.get(parLocation[parName])[0],decimals))
-               else: 
-                  print(parName,':', model.get(parLocation[parName])[0])
+            print(parName, ':', values[parName])               
    if mode in ['long','location']:
-      k = 0
-      for Location in [parLocation[k] for k in parDict.keys()]:
-         if name in Location:
-            if type(model.get(Location)[0]) != np.bool_:       
-               print(Location,':', dict_reverser(parLocation)[Location] , ':', np.round(model.get(Location)[0],decimals))
-         else:
-            k = k+1
-      if k == len(parLocation):
-         for parName in parDict.keys():
-            if name in parName:
-               if type(model.get(Location)[0]) != np.bool_:
-                  print(parLocation[parName], ':', dict_reverser(parLocation)[Location], ':', parName,':', 
-                     np.round(model.get(parLocation[parName])[0],decimals))
+      for parName in parNames:
+         if parLocation[parName] not in booleans:       
+            print(parLocation[parName], ':', parName, ':', round(values[parName].item(), decimals))
+
+# Boolean variables among locations - data types do not change so found once for given locations
+@functools.lru_cache(maxsize=None)
+def boolean_locations(locations):
+   """Return the set of locations that are Boolean variables"""
+   return frozenset(location for location in locations if model.get_variable_data_type(location) == FMI2_BOOLEAN)
 
 # Line types
 def setLines(lines=['-','--',':','-.']):
@@ -570,69 +429,164 @@ def setLines(lines=['-','--',':','-.']):
    global linecycler
    linecycler = cycle(lines)
 
+# Plot diagrams - functions of (t, sim_res, linetype) and for compatibility also strings to evaluate
+def plot_diagrams(diagrams, linetype):
+   """Plot diagrams from the latest simulation"""
+   variables = {'t': t, 'sim_res': sim_res, 'linetype': linetype}
+   for command in diagrams:
+      if callable(command):
+         command(t, sim_res, linetype)
+      else:
+         if command not in diagrams_compiled.keys():
+            diagrams_compiled[command] = compile(command, '<diagram>', 'eval')
+         eval(diagrams_compiled[command], globals(), variables)
+
+# Diagrams given as strings compiled once
+diagrams_compiled = {}
+
 # Show plots from sim_res, just that
 def show(diagrams=diagrams):
    """Show diagrams chosen by newplot()"""
    # Plot pen
    linetype = next(linecycler)    
    # Plot diagrams 
-   for command in diagrams: eval(command)
+   plot_diagrams(diagrams, linetype)
+
+# Simulation result where each variable is read once and then kept for diagrams
+class ResultCache:
+   """Wrapper of the result from model.simulate() that caches the variables read"""
+   def __init__(self, result):
+      self.result = result
+      self.data = {}
+   def __getitem__(self, key):
+      if key not in self.data:
+         self.data[key] = self.result[key]
+      return self.data[key]
+   def __getattr__(self, name):
+      # Only called for missing attributes - the own attributes and special methods are not forwarded
+      # since copy and pickle create the object without __init__ and probe them
+      if name in ['result', 'data'] or name.startswith('__'):
+         raise AttributeError(name)
+      return getattr(self.result, name)
+
+# Value references for bulk setting of parameters and initial state values
+def vref_cache(locations):
+   """ Return the keys and value references of the Real variables of locations, 
+       and a dictionary of the remaining variables that are set one by one. """
+   real_keys = []; real_vrefs = []; other = {}
+   for key in locations.keys():
+      if model.get_variable_data_type(locations[key]) == FMI2_REAL:
+         real_keys.append(key)
+         real_vrefs.append(model.get_variable_valueref(locations[key]))
+      else:
+         other[key] = locations[key]
+   return real_keys, np.array(real_vrefs, dtype=np.uint32), other
+
+def set_cached(cache, values):
+   """ Set values using a cache from vref_cache() - one set_real() call for all Real variables. """
+   real_keys, real_vrefs, other = cache
+   model.set_real(real_vrefs, np.fromiter((values[key] for key in real_keys), dtype=float, count=len(real_keys)))
+   for key in other.keys():
+      model.set(other[key], values[key])
+
+def get_cached(cache, values):
+   """ Get values using a cache from vref_cache() - one get_real() call for all Real variables. """
+   real_keys, real_vrefs, other = cache
+   values.update(zip(real_keys, model.get_real(real_vrefs)))
+   for key in other.keys():
+      values[key] = model.get(other[key])[0]
+
+def par_cache():
+   """ Value references of parDict - rebuilt only if the keys of parDict or their locations have changed """
+   global parCache, parCacheLocations
+   locations = tuple((key, parLocation[key]) for key in parDict.keys())
+   if parCache is None or parCacheLocations != locations:
+      parCache = vref_cache(dict(locations))
+      parCacheLocations = locations
+   return parCache
+
+def state_location(key):
+   """ Location of the initial value of a state, e.g. 'bioreactor.m[1]' gives 'bioreactor.m_0[1]' """
+   match = state_index.match(key)
+   if match:
+      return match.group(1)+'_0'+match.group(2)
+   else:
+      return key+'_0'
+
+state_index = re.compile(r'(.+?)(\[[0-9,]+\])$')
+
+# Check of parameter values - a value that differs from itself is NaN
+def par_missing(parDictLocal):
+   """ Print and return the keys of parDictLocal with missing values """
+   value_missing = [key for key, value in parDictLocal.items() if value is None or value == '' or value != value]
+   for key in value_missing:
+      print('Value missing:', key)
+   return value_missing
 
 # Simulation
-def simu(simulationTimeLocal=simulationTime, mode='Initial', diagrams=diagrams,timeDiscreteStates=timeDiscreteStates):
+def simu(simulationTimeLocal=simulationTime, mode='Initial', diagrams=diagrams,timeDiscreteStates=timeDiscreteStates, ncp=None, plot=True):
    """Model loaded and given intial values and parameter before,
-      and plot window also setup before."""
+      and plot window also setup before. The number of communication points
+      can be changed from opts['ncp'] for this simulation with ncp, and with
+      plot=False the diagrams are not updated."""
     
    # Global variables
    global model, parDict, stateDict, prevFinalTime, simulationTime, sim_res, t
+   global stateCache, stateFinalCache, simuPrevious
 
    # Transfer of argument to global variable
    simulationTime = simulationTimeLocal 
    
    # Check parDict
-   value_missing = 0
-   for key in parDict.keys():
-      if parDict[key] in [np.nan, None, '']:
-         print('Value missing:', key)
-         value_missing =+1
-   if value_missing>0: return
+   if par_missing(parDict): return
          
    # Load model
    if model is None:
       model = load_fmu(fmu_model) 
-   model.reset()
+      simuPrevious = None
+
+   # Value references of parDict
+   par_cache()
+
+   # Continued simulation of the model instance without reset and initialization, if parameters, their 
+   # locations and the state values are the same as after the previous simulation. Parameters changed by
+   # par() have variability fixed and need the model reset and initialized again.
+   try:
+      continued = mode in ['Continued', 'continued', 'cont'] \
+                  and simuPrevious == (parCacheLocations, dict(parDict), dict(stateDict))
+   except NameError:
+      continued = False
+   simuPrevious = None
+   if not continued:
+      model.reset()
+
+   # Simulation options
+   if ncp is None and not continued:
+      options = opts
+   else:
+      options = dict(opts)
+      if ncp is not None: options['ncp'] = ncp
+      if continued: options['initialize'] = False
       
    # Run simulation
    if mode in ['Initial', 'initial', 'init']:
       # Set parameters and intial state values:
-      for key in parDict.keys():
-         model.set(parLocation[key],parDict[key])   
+      set_cached(parCache, parDict)
       # Simulate
-      sim_res = model.simulate(final_time=simulationTime, options=opts)      
+      sim_res = ResultCache(model.simulate(final_time=simulationTime, options=options))
    elif mode in ['Continued', 'continued', 'cont']:
-      # Set parameters and intial state values:
-      for key in parDict.keys():
-         model.set(parLocation[key],parDict[key])                
-      try: 
-         for key in stateDict.keys():
-            if not key[-1] == ']':
-               model.set(key+'_0', stateDict[key])
-            elif key[-3] == '[':
-               model.set(key[:-3]+'_0'+key[-3:], stateDict[key]) 
-            elif key[-4] == '[':
-               model.set(key[:-4]+'_0'+key[-4:], stateDict[key]) 
-            elif key[-5] == '[':
-               model.set(key[:-5]+'_0'+key[-5:], stateDict[key]) 
-            else:
-               print('The state vecotr has more than 1000 states')
-               break
-      except NameError:
-         print("Simulation is first done with default mode='init'")
-         prevFinalTime = 0
+      # Set parameters and intial state values, unless the model instance is continued
+      if not continued:
+         set_cached(parCache, parDict)
+         try: 
+            set_cached(stateCache, stateDict)
+         except NameError:
+            print("Simulation is first done with default mode='init'")
+            prevFinalTime = 0
       # Simulate
-      sim_res = model.simulate(start_time=prevFinalTime,
-                              final_time=prevFinalTime + simulationTime,
-                              options=opts)     
+      sim_res = ResultCache(model.simulate(start_time=prevFinalTime,
+                                           final_time=prevFinalTime + simulationTime,
+                                           options=options))
    else:
       print("Simulation mode not correct")
     
@@ -640,8 +594,9 @@ def simu(simulationTimeLocal=simulationTime, mode='Initial', diagrams=diagrams,t
    t = sim_res['time']
  
    # Plot diagrams
-   linetype = next(linecycler)    
-   for command in diagrams: eval(command)
+   if plot:
+      linetype = next(linecycler)    
+      plot_diagrams(diagrams, linetype)
             
    # Store final state values stateDict:
    try: stateDict
@@ -649,38 +604,112 @@ def simu(simulationTimeLocal=simulationTime, mode='Initial', diagrams=diagrams,t
       stateDict = {}
       stateDict = model.get_states_list()
       stateDict.update(timeDiscreteStates)
-   for key in list(stateDict.keys()):
-      stateDict[key] = model.get(key)[0]        
+      stateCache = vref_cache({key: state_location(key) for key in stateDict.keys()})
+      stateFinalCache = vref_cache({key: key for key in stateDict.keys()})
+   get_cached(stateFinalCache, stateDict)
 
    # Store time from where simulation will start next time
    prevFinalTime = model.time
+
+   # Store what the model instance is simulated with
+   simuPrevious = (parCacheLocations, dict(parDict), dict(stateDict))
    
+# Parameter sweep with simulations in parallel processes, each with its own instance of the FMU
+def simu_batch(parList, simulationTimeLocal=simulationTime, variables=['bioreactor.V'], processes=None, ncp=None, parallel=True):
+   """ Simulate from the current parDict changed by each dictionary in parList, 
+       e.g. parList = [{'F1': 0.002}, {'F1': 0.004}], and return a list with time and variables. 
+       The simulations are not plotted. Parallel processes are started with fork and need Linux,
+       otherwise, or with parallel=False, the simulations are done one by one with the loaded model. 
+       Parameter names and missing values are checked first and then None is returned at error. 
+       A lower number of communication points ncp than in opts['ncp'] makes sweeps faster. """
+   global model, simuPrevious
+   # Check parameter names as par() does and values as simu() does
+   names_wrong = list(dict.fromkeys(key for x in parList for key in x.keys() if key not in parDict.keys()))
+   for key in names_wrong:
+      print('Error:', key, '- seems not an accessible parameter - check the spelling')
+   if names_wrong: return
+   parDicts = []
+   for x in parList:
+      parDicts.append(dict(parDict)); parDicts[-1].update(x)
+      if par_missing(parDicts[-1]): return
+   options = dict(opts)
+   options['silent_mode'] = True
+   if ncp is not None: options['ncp'] = ncp
+   options['filter'] = [name.replace('[', '[[]') for name in variables]
+   par_cache()
+   if not parallel or platform.system() != 'Linux':
+      if model is None:
+         model = load_fmu(fmu_model)
+      simuPrevious = None
+      return [simu_batch_run(x, simulationTimeLocal, variables, options) for x in parDicts]
+   # The pool is closed and joined, not terminated, so the processes exit normally and release their FMU
+   pool = multiprocessing.get_context('fork').Pool(processes, initializer=simu_batch_init)
+   try:
+      return pool.starmap(simu_batch_run, [(x, simulationTimeLocal, variables, options) for x in parDicts])
+   finally:
+      pool.close()
+      pool.join()
+
+def sweep(grid, simulationTimeLocal=simulationTime, variables=['bioreactor.V'], processes=None, ncp=None, parallel=True):
+   """ Simulate all combinations of parameter values in grid, e.g. grid = {'F1': [0.002, 0.004], 'V_0': [0.4, 0.5]},
+       with simu_batch() and return a dictionary of the results with the combination of values as key. 
+       The simulations are done in parallel processes on Linux, otherwise or with parallel=False one by one. """
+   combinations = list(product(*grid.values()))
+   parList = [dict(zip(grid.keys(), x)) for x in combinations]
+   results = simu_batch(parList, simulationTimeLocal, variables, processes, ncp, parallel)
+   if results is not None:
+      return dict(zip(combinations, results))
+
+def simu_batch_init():
+   """ Load the FMU in a new process of simu_batch() and release it when the process exits """
+   global model, model_forked
+   # The forked copy of the model of the main process is kept and never released in this process, 
+   # since that would remove the unpacked FMU files that the main process still use
+   model_forked = model
+   model = load_fmu(fmu_model, log_level=0)
+   multiprocessing.util.Finalize(None, simu_batch_exit, exitpriority=10)
+
+def simu_batch_exit():
+   """ Release the FMU of a process of simu_batch() - pyfmi then frees the instance and its unpacked files """
+   global model
+   model = None
+
+def simu_batch_run(parDictLocal, simulationTimeLocal, variables, options):
+   """ Simulation in a process of simu_batch(), or with the loaded model when done one by one """
+   model.reset()
+   set_cached(parCache, parDictLocal)
+   result = model.simulate(final_time=simulationTimeLocal, options=options)
+   return {key: np.asarray(result[key]) for key in ['time'] + variables}
+
 # Describe model parts of the combined system
+model_components = None
+
+# Component of a variable name - first character and then up to the first '.' or '('
+component_name = re.compile(r'.[^.(]*')
+
+# Names that are not model parts
+components_skipped = frozenset(['der', 'temp_1', 'temp_2', 'temp_3', 'temp_4', 'temp_5', 'temp_6', 'temp_7'])
+components_excluded = frozenset(['','BPL', 'Customer', 'today[1]', 'today[2]', 'today[3]', 'temp_2', 'temp_3'])
+
 def describe_parts(component_list=[]):
    """List all parts of the model""" 
        
    def model_component(variable_name):
-      i = 0
       name = ''
-      finished = False
       if not variable_name[0] == '_':
-         while not finished:
-            name = name + variable_name[i]
-            if i == len(variable_name)-1:
-                finished = True 
-            elif variable_name[i+1] in ['.', '(']: 
-                finished = True
-            else: 
-                i=i+1
-      if name in ['der', 'temp_1', 'temp_2', 'temp_3', 'temp_4', 'temp_5', 'temp_6', 'temp_7']: name = ''
+         name = component_name.match(variable_name).group(0)
+      if name in components_skipped: name = ''
       return name
     
-   variables = list(model.get_model_variables().keys())
+   # Components of all model variables, in order of appearance, found at first call only
+   global model_components
+   if model_components is None:
+      model_components = list(dict.fromkeys(model_component(variable) for variable in model.get_model_variables().keys()))
         
-   for i in range(len(variables)):
-      component = model_component(variables[i])
-      if (component not in component_list) \
-      & (component not in ['','BPL', 'Customer', 'today[1]', 'today[2]', 'today[3]', 'temp_2', 'temp_3']):
+   seen = set(component_list)
+   for component in model_components:
+      if component not in seen and component not in components_excluded:
+         seen.add(component)
          component_list.append(component)
       
    print(sorted(component_list, key=str.casefold))
@@ -689,6 +718,16 @@ def describe_MSL():
    """List MSL version and components used"""
    print('MSL:', model.get('MSL.version')[0],'- used components:', model.get('MSL.usage')[0])
 
+# Description and unit of variables do not change and are looked up only once for each variable
+@functools.lru_cache(maxsize=None)
+def variable_info(location):
+   """Return description and unit of a variable, and unit '' if not given"""
+   try:
+      unit = model.get_variable_unit(location)
+   except FMUException:
+      unit = ''
+   return model.get_variable_description(location), unit
+
 # Describe parameters and variables in the Modelica code
 def describe_general(name, decimals):
   
@@ -697,35 +736,15 @@ def describe_general(name, decimals):
       unit = 'h'
       print(description,'[',unit,']')
       
-   elif name in parLocation.keys():
-      description = model.get_variable_description(parLocation[name])
-      value = model.get(parLocation[name])[0]
-      try:
-         unit = model.get_variable_unit(parLocation[name])
-      except FMUException:
-         unit =''
-      if unit =='':
-         if type(value) != np.bool_:
-            print(description, ':', np.round(value, decimals))
-         else:
-            print(description, ':', value)            
-      else:
-        print(description, ':', np.round(value, decimals), '[',unit,']')
-                  
    else:
-      description = model.get_variable_description(name)
-      value = model.get(name)[0]
-      try:
-         unit = model.get_variable_unit(name)
-      except FMUException:
-         unit =''
+      location = parLocation.get(name, name)
+      description, unit = variable_info(location)
+      value = model.get(location)[0]
+      if not isinstance(value, (bool, np.bool_)): value = round(value.item(), decimals)
       if unit =='':
-         if type(value) != np.bool_:
-            print(description, ':', np.round(value, decimals))
-         else:
-            print(description, ':', value)     
+         print(description, ':', value)
       else:
-         print(description, ':', np.round(value, decimals), '[',unit,']')
+         print(description, ':', value, '[',unit,']')
          
 # Describe framework
 def BPL_info():
@@ -740,13 +759,29 @@ def BPL_info():
    print(' - describe()  - describe culture, broth, parameters, variables with values / units')
    print()
    print('Note that both disp() and describe() takes values from the last simulation')
+   print('and that opts[\'filter\'] = result_filter makes simulations faster but stores only variables of newplot()')
    print()
    print('Brief information about a command by help(), eg help(simu)') 
    print('Key system information is listed with the command system_info()')
 
+@functools.lru_cache(maxsize=None)
+def system_info_static():
+   """Versions and FMU information that do not change during a session, collected once"""
+   try:
+      from importlib.metadata import version
+   except ImportError:
+      from importlib_metadata import version   # Python 3.7
+   return {'PyFMI': version('pyfmi'),
+           'FMU by': model.get_generation_tool(),
+           'FMI': model.get_version(),
+           'Type': model.__class__.__name__,
+           'Name': model.get_name(),
+           'Generated': model.get_generation_date_and_time(),
+           'MSL': model.get('MSL.version')[0],
+           'Description': model.get('BPL.version')[0]}
+
 def system_info():
    """Print system information"""
-   FMU_type = model.__class__.__name__
    print()
    print('System information')
    print(' -OS:', platform.system())
@@ -756,14 +791,8 @@ def system_info():
        print(' -Scipy:',scipy_ver)
    except NameError:
        print(' -Scipy: not installed in the notebook')
-   print(' -PyFMI:', version('pyfmi'))
-   print(' -FMU by:', model.get_generation_tool())
-   print(' -FMI:', model.get_version())
-   print(' -Type:', FMU_type)
-   print(' -Name:', model.get_name())
-   print(' -Generated:', model.get_generation_date_and_time())
-   print(' -MSL:', model.get('MSL.version')[0])
-   print(' -Description:', model.get('BPL.version')[0])  
+   for key, value in system_info_static().items():
+      print(' -'+key+':', value)
    print(' -Interaction:', FMU_explore)
    
 #------------------------------------------------------------------------------------------------------------------